@@ -10,6 +10,15 @@ __author__ = "LC MCP Team"
 __email__ = "team@lcmcp.dev"
 
 from .config import Settings
-from .server import create_app
 
 __all__ = ["Settings", "create_app", "__version__"]
+
+
+def __getattr__(name: str):
+    # Import the server lazily so the CLI does not load FastAPI and the
+    # whole app just to parse arguments or run the HTTP client.
+    if name == "create_app":
+        from .server import create_app
+
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
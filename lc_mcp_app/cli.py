@@ -5,15 +5,18 @@ Command-line interface for LC MCP App server and client.
 import argparse
 import asyncio
 import sys
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
 import orjson
-import uvicorn
 
 from .config import settings
 from .observability.logging import configure_logging, get_logger
 
+if TYPE_CHECKING:
+    import httpx
+
 
 def server_main():
     """Main entry point for the LC MCP App server."""
@@ -61,15 +64,28 @@ def server_main():
         help=f"Number of worker processes (default: {settings.app_workers})"
     )
 
+    parser.add_argument(
+        "--debug-loop",
+        action="store_true",
+        help="Use the stdlib asyncio event loop even when uvloop is installed"
+    )
+
     args = parser.parse_args()
 
-    # Override settings with command line arguments
-    settings.app_host = args.host
-    settings.app_port = args.port
-    settings.environment = args.environment
-    settings.app_log_level = args.log_level
-    settings.app_reload = args.reload
-    settings.app_workers = args.workers
+    # Override settings with command line arguments. The shared settings
+    # instance is updated in place (not copied) because other modules hold
+    # a reference to it; only values that actually differ are written.
+    overrides = {
+        "app_host": args.host,
+        "app_port": args.port,
+        "environment": args.environment,
+        "app_log_level": args.log_level,
+        "app_reload": args.reload,
+        "app_workers": args.workers,
+    }
+    for name, value in overrides.items():
+        if getattr(settings, name) != value:
+            setattr(settings, name, value)
 
     # Setup logging
     configure_logging(settings.app_log_level)
@@ -94,6 +110,9 @@ def server_main():
             logger.error("Production validation failed", error=str(e))
             sys.exit(1)
 
+    # Imported here so --help and argument errors skip the uvicorn import
+    import uvicorn
+
     # Start the server
     try:
         uvicorn.run(
@@ -103,7 +122,8 @@ def server_main():
             log_level=args.log_level,
             reload=args.reload,
             workers=args.workers if not args.reload else 1,
-            loop="uvloop" if not settings.is_development else "auto"
+            # "auto" picks uvloop when it is importable and asyncio otherwise
+            loop="asyncio" if args.debug_loop else "auto"
         )
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
@@ -185,8 +205,59 @@ def client_main():
     asyncio.run(run_client(args, logger))
 
 
+def _emit(obj) -> None:
+    """Write obj as indented JSON to stdout without a str round-trip."""
+    sys.stdout.flush()  # Text output must land before raw byte writes
+    sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
+
+
+def _print_health(health_data: dict, verbose: bool) -> None:
+    """Print a /health response."""
+    print(f"Server Status: {health_data['status']}")
+    print(f"Version: {health_data['version']}")
+    print(f"Environment: {health_data['environment']}")
+    print(f"MCP Server: {'✓' if health_data['mcp_server']['healthy'] else '✗'}")
+    print(f"Tools: {health_data['tools']['total_tools']}")
+
+    if verbose:
+        print("\nDetailed health info:")
+        _emit(health_data)
+
+
+def _print_models(models_data: dict, verbose: bool) -> None:
+    """Print a /v1/models response."""
+    print(f"Available models ({len(models_data['data'])}):")
+    for model in models_data["data"]:
+        print(f"  - {model['id']} (owned by: {model['owned_by']})")
+
+
+def _print_tools(tools_data: dict, verbose: bool) -> None:
+    """Print a /tools response."""
+    print(f"Available tools ({tools_data['total']}):")
+    for tool in tools_data["tools"]:
+        print(f"  - {tool['name']}: {tool['description']}")
+
+    if verbose:
+        print(f"\nRegistry info: {tools_data['registry_info']}")
+
+
+async def _iter_sse_data(response: "httpx.Response") -> AsyncIterator[bytes]:
+    """Yield the raw payload of each SSE ``data:`` line without decoding to str."""
+    buf = bytearray()
+    async for chunk in response.aiter_bytes():
+        buf += chunk
+        while (nl := buf.find(b"\n")) != -1:
+            line = bytes(buf[:nl]).rstrip(b"\r")
+            del buf[:nl + 1]
+            if line.startswith(b"data: "):
+                yield line[6:]  # Remove "data: " prefix
+
+
 async def run_client(args, logger):
     """Run the async client operations."""
+    import httpx  # Deferred so parsing arguments does not pay for it
+
     # Prepare headers
     headers = {"Content-Type": "application/json"}
     if args.api_key:
@@ -197,46 +268,25 @@ async def run_client(args, logger):
     try:
         async with httpx.AsyncClient(timeout=timeout) as client:
 
+            # Independent queries are sent concurrently over the shared
+            # connection pool and printed in a fixed order
+            queries = []
             if args.health:
-                # Health check
-                response = await client.get(f"{args.server}/health", headers=headers)
-                response.raise_for_status()
-
-                health_data = response.json()
-                print(f"Server Status: {health_data['status']}")
-                print(f"Version: {health_data['version']}")
-                print(f"Environment: {health_data['environment']}")
-                print(f"MCP Server: {'✓' if health_data['mcp_server']['healthy'] else '✗'}")
-                print(f"Tools: {health_data['tools']['total_tools']}")
-
-                if args.verbose:
-                    print("\nDetailed health info:")
-                    print(orjson.dumps(health_data, option=orjson.OPT_INDENT_2).decode())
-
-            elif args.list_models:
-                # List models
-                response = await client.get(f"{args.server}/v1/models", headers=headers)
-                response.raise_for_status()
-
-                models_data = response.json()
-                print(f"Available models ({len(models_data['data'])}):")
-                for model in models_data["data"]:
-                    print(f"  - {model['id']} (owned by: {model['owned_by']})")
-
-            elif args.list_tools:
-                # List tools
-                response = await client.get(f"{args.server}/tools", headers=headers)
-                response.raise_for_status()
-
-                tools_data = response.json()
-                print(f"Available tools ({tools_data['total']}):")
-                for tool in tools_data["tools"]:
-                    print(f"  - {tool['name']}: {tool['description']}")
-
-                if args.verbose:
-                    print(f"\nRegistry info: {tools_data['registry_info']}")
+                queries.append(("/health", _print_health))
+            if args.list_models:
+                queries.append(("/v1/models", _print_models))
+            if args.list_tools:
+                queries.append(("/tools", _print_tools))
+
+            if queries:
+                responses = await asyncio.gather(
+                    *(client.get(f"{args.server}{path}", headers=headers) for path, _ in queries)
+                )
+                for response, (_, show) in zip(responses, queries, strict=True):
+                    response.raise_for_status()
+                    show(orjson.loads(response.content), args.verbose)
 
-            elif args.chat:
+            if args.chat:
                 # Send chat message
                 payload = {
                     "model": settings.openai_default_model,
@@ -254,17 +304,19 @@ async def run_client(args, logger):
                         json=payload
                     ) as response:
                         response.raise_for_status()
-                        async for line in response.aiter_lines():
-                            if line.startswith("data: "):
-                                data = line[6:]  # Remove "data: " prefix
-                                if data == "[DONE]":
-                                    break
-                                try:
-                                    chunk = orjson.loads(data)
-                                    if chunk["choices"][0]["delta"].get("content"):
-                                        print(chunk["choices"][0]["delta"]["content"], end="", flush=True)
-                                except Exception:
-                                    pass
+                        sys.stdout.flush()  # Text output must land before raw byte writes
+                        out = sys.stdout.buffer
+                        async for data in _iter_sse_data(response):
+                            if data == b"[DONE]":
+                                break
+                            try:
+                                chunk = orjson.loads(data)
+                                content = chunk["choices"][0]["delta"].get("content")
+                                if content:
+                                    out.write(content.encode())
+                                    out.flush()
+                            except Exception:
+                                pass
                     print()  # New line after streaming
                 else:
                     # Non-streaming chat
@@ -275,11 +327,11 @@ async def run_client(args, logger):
                     )
                     response.raise_for_status()
 
-                    chat_data = response.json()
+                    chat_data = orjson.loads(response.content)
                     print("Response:")
                     print(chat_data["choices"][0]["message"]["content"])
 
-            elif args.call_tool:
+            if args.call_tool:
                 # Call specific tool
                 params = {}
                 if args.params:
@@ -296,11 +348,11 @@ async def run_client(args, logger):
                 )
                 response.raise_for_status()
 
-                result = response.json()
+                result = orjson.loads(response.content)
                 print("Tool result:")
-                print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+                _emit(result)
 
-            else:
+            if not (queries or args.chat or args.call_tool):
                 # parser.print_help() - parser not defined in this scope
                 print("Usage: lc-mcp-app [command] [options]")
 
@@ -31,6 +31,10 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_rpm: int = Field(default=120, description="Rate limit requests per minute")
     rate_limit_burst: int = Field(default=60, description="Rate limit burst capacity")
+    rate_limit_max_tracked_ips: int = Field(default=100_000, gt=0, description="Max client IPs tracked by the rate limiter")
+    rate_limit_backend: str = Field(default="memory", description="Rate limit backend (memory/redis)")
+    redis_url: str = Field(default="redis://localhost:6379/0", description="Redis URL for the redis rate limit backend")
+    redis_timeout_s: float = Field(default=0.1, gt=0, description="Redis connect/command timeout in seconds")
 
     # MCP Server Configuration
     mcp_server_base_url: str = Field(default="http://127.0.0.1:8081", description="MCP server base URL")
@@ -76,6 +80,13 @@ class Settings(BaseSettings):
             raise ValueError("Environment must be 'development', 'production', or 'testing'")
         return v
 
+    @validator("rate_limit_backend")
+    def validate_rate_limit_backend(cls, v: str) -> str:
+        """Validate rate limit backend."""
+        if v not in ["memory", "redis"]:
+            raise ValueError("Rate limit backend must be 'memory' or 'redis'")
+        return v
+
     @validator("openai_temperature")
     def validate_temperature(cls, v: float) -> float:
         """Validate temperature range."""
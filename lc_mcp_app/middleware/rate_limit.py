@@ -2,19 +2,80 @@
 Rate limiting middleware using token bucket algorithm.
 """
 
-import asyncio
+import math
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict
 
-from fastapi import HTTPException, Request
+import orjson
+import redis.asyncio as aioredis
+from fastapi import Request
+from redis.exceptions import RedisError
+from starlette.responses import Response
 
 from ..config import settings
 from ..observability.logging import get_logger
 
 logger = get_logger("middleware.rate_limit")
 
-# Simple in-process token bucket per IP (good enough for single-instance)
-buckets: dict[str, deque[float]] = defaultdict(deque)
+# Rate limit window in seconds
+WINDOW = 60.0
+
+# Endpoints that are never rate limited
+EXEMPT_ENDPOINTS = frozenset({"/health", "/metrics"})
+
+# Minimum seconds between "Redis unavailable" warnings during an outage
+REDIS_WARNING_INTERVAL = 60.0
+
+# Static part of the 429 response body
+RATE_LIMIT_ERROR = {"error": "Rate limit exceeded", "window": "1 minute"}
+
+
+class BucketState:
+    """Token bucket state for a single client: available tokens and last refill time."""
+
+    __slots__ = ("tokens", "last_refill")
+
+    def __init__(self, tokens: float, last_refill: float):
+        self.tokens = tokens
+        self.last_refill = last_refill
+
+
+# Simple in-process token bucket per IP (good enough for single-instance).
+# Buckets are only touched from the event loop, so no locking is needed; with
+# --workers > 1 each process keeps its own buckets and limits become per-worker,
+# so use rate_limit_backend="redis" to share them. Kept in LRU order so the
+# least recently seen client is evicted once settings.rate_limit_max_tracked_ips
+# is reached.
+buckets: OrderedDict[str, BucketState] = OrderedDict()
+
+# Atomically refill and take one token from the bucket hash at KEYS[1].
+# ARGV: now (seconds), capacity, refill rate (tokens/second), key TTL (seconds).
+# Returns {allowed (0/1), tokens left as a string to keep the fraction}.
+TOKEN_BUCKET_LUA = """
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local now = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local rate = tonumber(ARGV[3])
+local tokens = tonumber(state[1])
+if tokens == nil then
+  tokens = capacity
+else
+  tokens = math.min(capacity, tokens + math.max(0, now - tonumber(state[2])) * rate)
+end
+local allowed = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return {allowed, tostring(tokens)}
+"""
+
+# Redis connection pool and registered script, set up by init_rate_limit_backend()
+_redis: aioredis.Redis | None = None
+_redis_script = None
+_redis_last_warning = float("-inf")
 
 
 def _now() -> float:
@@ -24,79 +85,149 @@ def _now() -> float:
 
 def _get_client_ip(request: Request) -> str:
     """Extract client IP from request."""
-    # Try to get real IP from headers (for reverse proxy setups)
-    forwarded_for = request.headers.get("x-forwarded-for")
-    if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+    # Try to get real IP from headers (for reverse proxy setups). The raw
+    # ASGI header list is scanned once; names are already lowercase.
+    real_ip = None
+    for name, value in request.scope["headers"]:
+        if name == b"x-forwarded-for":
+            if value:
+                return value.split(b",", 1)[0].strip().decode("latin-1")
+        elif name == b"x-real-ip" and real_ip is None:
+            real_ip = value
 
-    real_ip = request.headers.get("x-real-ip")
     if real_ip:
-        return real_ip.strip()
+        return real_ip.strip().decode("latin-1")
 
     # Fall back to direct client IP
-    if request.client:
-        return request.client.host
+    client = request.scope.get("client")
+    if client:
+        return client[0]
 
     return "unknown"
 
 
+def _take_token_memory(ip: str, now: float, capacity: int, refill_rate: float) -> tuple[bool, float]:
+    """Refill and take one token from the in-process bucket for ip."""
+    # Get or create bucket for this IP, then refill for the elapsed time
+    state = buckets.get(ip)
+    if state is None:
+        if len(buckets) >= settings.rate_limit_max_tracked_ips:
+            buckets.popitem(last=False)
+        state = buckets[ip] = BucketState(float(capacity), now)
+    else:
+        buckets.move_to_end(ip)
+        elapsed = now - state.last_refill
+        state.tokens = min(capacity, state.tokens + elapsed * refill_rate)
+        state.last_refill = now
+
+    if state.tokens < 1.0:
+        return False, state.tokens
+
+    state.tokens -= 1.0
+    return True, state.tokens
+
+
+async def _take_token_redis(ip: str, now: float, capacity: int, refill_rate: float) -> tuple[bool, float]:
+    """Refill and take one token from the shared Redis bucket for ip."""
+    ttl = math.ceil(capacity / refill_rate)  # A bucket idle this long is full again
+    allowed, tokens = await _redis_script(keys=[f"rl:{ip}"], args=[now, capacity, refill_rate, ttl])
+    return bool(allowed), float(tokens)
+
+
+def _warn_redis_unavailable(now: float, error: Exception) -> None:
+    """Log a Redis failure at most once per REDIS_WARNING_INTERVAL."""
+    global _redis_last_warning
+    if now - _redis_last_warning < REDIS_WARNING_INTERVAL:
+        logger.debug("Redis rate limit backend unavailable", error=str(error))
+        return
+
+    _redis_last_warning = now
+    logger.warning("Redis rate limit backend unavailable", error=str(error))
+
+
+async def init_rate_limit_backend() -> None:
+    """Connect the shared rate limit store when the Redis backend is configured."""
+    global _redis, _redis_script
+    if settings.rate_limit_backend != "redis" or _redis is not None:
+        return
+
+    # Short timeouts so a hung Redis degrades to per-worker limits instead of
+    # stalling every request until the OS TCP timeout
+    _redis = aioredis.Redis.from_url(
+        settings.redis_url,
+        socket_connect_timeout=settings.redis_timeout_s,
+        socket_timeout=settings.redis_timeout_s,
+    )
+    # register_script uses EVALSHA and loads the script on first NOSCRIPT
+    _redis_script = _redis.register_script(TOKEN_BUCKET_LUA)
+    logger.info("Redis rate limit backend initialized", redis_url=settings.redis_url)
+
+
+async def close_rate_limit_backend() -> None:
+    """Close the Redis connection pool, if any."""
+    global _redis, _redis_script
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+        _redis_script = None
+
+
 async def rate_limit(request: Request, call_next):
     """Rate limiting middleware using token bucket algorithm."""
-    # Skip rate limiting for health and metrics endpoints
-    exempt_endpoints = {"/health", "/metrics"}
-
-    if request.url.path in exempt_endpoints:
+    # Skip rate limiting for health and metrics endpoints. The raw scope path
+    # avoids building request.url for every request.
+    path = request.scope["path"]
+    if path in EXEMPT_ENDPOINTS:
         return await call_next(request)
 
     ip = _get_client_ip(request)
-    window = 60.0  # 1 minute window
     max_requests = settings.rate_limit_rpm
-    burst_capacity = settings.rate_limit_burst
-
-    # Get or create bucket for this IP
-    bucket = buckets[ip]
+    capacity = max_requests + settings.rate_limit_burst
+    # With rpm=0 the burst still refills once per window, as the old sliding
+    # window allowed; "or 1" keeps a zero-capacity bucket from dividing by zero
+    refill_rate = (max_requests or capacity or 1) / WINDOW  # tokens per second
     current_time = _now()
 
-    # Remove old requests outside the window
-    while bucket and current_time - bucket[0] > window:
-        bucket.popleft()
+    if _redis_script is not None:
+        try:
+            allowed, tokens = await _take_token_redis(ip, current_time, capacity, refill_rate)
+        except RedisError as e:
+            # Fail over to per-process limits rather than rejecting or failing open
+            _warn_redis_unavailable(current_time, e)
+            allowed, tokens = _take_token_memory(ip, current_time, capacity, refill_rate)
+    else:
+        allowed, tokens = _take_token_memory(ip, current_time, capacity, refill_rate)
 
     # Check if we're over the limit (including burst)
-    if len(bucket) >= max_requests + burst_capacity:
+    if not allowed:
+        retry_after = max(math.ceil((1.0 - tokens) / refill_rate), 1)
+
         logger.warning(
             "Rate limit exceeded",
             client_ip=ip,
-            path=request.url.path,
-            current_requests=len(bucket),
+            path=path,
             limit=max_requests,
-            burst=burst_capacity
+            burst=settings.rate_limit_burst
         )
 
-        # Calculate retry after
-        oldest_request = bucket[0] if bucket else current_time
-        retry_after = int(oldest_request + window - current_time)
-
-        raise HTTPException(
+        # Returned directly: exceptions raised from HTTP middleware bypass
+        # FastAPI's exception handlers and surface as 500s
+        return Response(
+            content=orjson.dumps(
+                {"detail": {**RATE_LIMIT_ERROR, "limit": max_requests, "retry_after": retry_after}}
+            ),
             status_code=429,
-            detail={
-                "error": "Rate limit exceeded",
-                "limit": max_requests,
-                "window": "1 minute",
-                "retry_after": max(retry_after, 1)
-            },
+            media_type="application/json",
             headers={
-                "Retry-After": str(max(retry_after, 1)),
+                "Retry-After": str(retry_after),
                 "X-RateLimit-Limit": str(max_requests),
                 "X-RateLimit-Remaining": "0",
-                "X-RateLimit-Reset": str(int(oldest_request + window))
+                "X-RateLimit-Reset": str(int(current_time + retry_after))
             }
         )
 
-    # Add current request to bucket
-    bucket.append(current_time)
-
-    # Calculate remaining requests
-    remaining = max(0, max_requests - len(bucket))
+    remaining = int(tokens)
+    reset_at = int(current_time + (capacity - tokens) / refill_rate)
 
     # Process request
     response = await call_next(request)
@@ -104,39 +235,13 @@ async def rate_limit(request: Request, call_next):
     # Add rate limit headers to response
     response.headers["X-RateLimit-Limit"] = str(max_requests)
     response.headers["X-RateLimit-Remaining"] = str(remaining)
-    response.headers["X-RateLimit-Reset"] = str(int(current_time + window))
+    response.headers["X-RateLimit-Reset"] = str(reset_at)
 
     logger.debug(
         "Rate limit check passed",
         client_ip=ip,
-        path=request.url.path,
-        current_requests=len(bucket),
+        path=path,
         remaining=remaining
     )
 
     return response
-
-
-def cleanup_old_buckets():
-    """Clean up old rate limit buckets to prevent memory leaks."""
-    current_time = _now()
-    cutoff_time = current_time - 300  # 5 minutes
-
-    to_remove = []
-    for ip, bucket in buckets.items():
-        if not bucket or (bucket and current_time - bucket[-1] > cutoff_time):
-            to_remove.append(ip)
-
-    for ip in to_remove:
-        del buckets[ip]
-
-    if to_remove:
-        logger.debug(f"Cleaned up {len(to_remove)} old rate limit buckets")
-
-
-# Periodic cleanup (called from background task)
-async def periodic_cleanup():
-    """Periodic cleanup of rate limit buckets."""
-    while True:
-        await asyncio.sleep(300)  # Every 5 minutes
-        cleanup_old_buckets()
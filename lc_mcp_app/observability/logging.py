@@ -3,11 +3,13 @@ Structured logging configuration with correlation IDs.
 """
 
 import logging
+import re
 import sys
 import uuid
 from contextvars import ContextVar
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import FilteringBoundLogger
 
@@ -16,10 +18,24 @@ from ..config import settings
 # Context variable for correlation ID
 correlation_id: ContextVar[str | None] = ContextVar("correlation_id", default=None)
 
+# Substrings that mark a log key as sensitive (matched case-insensitively)
+SENSITIVE_KEYS = (
+    "password", "token", "key", "secret", "auth", "authorization",
+    "api_key", "openai_api_key", "mcp_password"
+)
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_KEYS)), re.IGNORECASE)
+
+
+# Bound once so the per-event processor skips the attribute lookup
+_get_correlation_id = correlation_id.get
+
+# Service fields added to every event; filled in by configure_logging()
+_service_info: dict[str, str] = {}
+
 
 def add_correlation_id(logger: FilteringBoundLogger, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Add correlation ID to log events."""
-    corr_id = correlation_id.get()
+    corr_id = _get_correlation_id()
     if corr_id:
         event_dict["correlation_id"] = corr_id
     return event_dict
@@ -27,38 +43,63 @@ def add_correlation_id(logger: FilteringBoundLogger, method_name: str, event_dic
 
 def add_service_info(logger: FilteringBoundLogger, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Add service information to log events."""
-    event_dict["service"] = "lc-mcp-app"
-    event_dict["version"] = "0.1.0"
-    event_dict["environment"] = settings.environment
+    event_dict.update(_service_info)
     return event_dict
 
 
-def sanitize_sensitive_data(logger: FilteringBoundLogger, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
-    """Sanitize sensitive data from log events."""
-    sensitive_keys = {
-        "password", "token", "key", "secret", "auth", "authorization",
-        "api_key", "openai_api_key", "mcp_password"
-    }
-
-    def sanitize_dict(d: dict[str, Any]) -> dict[str, Any]:
-        sanitized = {}
-        for k, v in d.items():
-            if any(sensitive in k.lower() for sensitive in sensitive_keys):
+def _has_sensitive_key(d: dict[str, Any]) -> bool:
+    """Check whether any key at any depth of ``d`` is sensitive."""
+    stack = [d]
+    while stack:
+        for k, v in stack.pop().items():
+            if _SENSITIVE_RE.search(k):
+                return True
+            if isinstance(v, dict):
+                stack.append(v)
+    return False
+
+
+def _sanitize_dict(d: dict[str, Any]) -> dict[str, Any]:
+    """Redact values stored under sensitive keys, copying only when needed."""
+    if not _has_sensitive_key(d):
+        return d
+
+    sanitized: dict[str, Any] = {}
+    stack = [(d, sanitized)]
+    while stack:
+        src, dst = stack.pop()
+        for k, v in src.items():
+            if _SENSITIVE_RE.search(k):
                 if isinstance(v, str) and len(v) > 8:
-                    sanitized[k] = f"{v[:4]}***{v[-4:]}"
+                    dst[k] = f"{v[:4]}***{v[-4:]}"
                 else:
-                    sanitized[k] = "***REDACTED***"
+                    dst[k] = "***REDACTED***"
             elif isinstance(v, dict):
-                sanitized[k] = sanitize_dict(v)
+                dst[k] = child = {}
+                stack.append((v, child))
             else:
-                sanitized[k] = v
-        return sanitized
+                dst[k] = v
+    return sanitized
 
-    return sanitize_dict(event_dict)
+
+def sanitize_sensitive_data(logger: FilteringBoundLogger, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Sanitize sensitive data from log events."""
+    return _sanitize_dict(event_dict)
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Render with orjson but return text so logs share print()'s stdout buffer."""
+    return orjson.dumps(obj, **kwargs).decode()
 
 
 def configure_logging(level: str = "info") -> None:
     """Configure structured logging with appropriate settings."""
+    _service_info.update(
+        service="lc-mcp-app",
+        version="0.1.0",
+        environment=settings.environment,
+    )
+
     # Configure structlog
     processors = [
         structlog.contextvars.merge_contextvars,
@@ -71,7 +112,7 @@ def configure_logging(level: str = "info") -> None:
     ]
 
     if settings.log_format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         processors.extend([
             structlog.dev.ConsoleRenderer(colors=True),
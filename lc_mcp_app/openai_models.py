@@ -2,9 +2,12 @@
 OpenAI-compatible API models and response generation.
 """
 
+import asyncio
+import operator
 import time
 import uuid
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
 import orjson
@@ -15,6 +18,21 @@ from .observability.logging import get_logger
 
 logger = get_logger("openai_models")
 
+# Characters of response text sent per streamed chunk
+STREAM_CHUNK_CHARS = 16
+
+# Average characters per token for English text (OpenAI rule of thumb)
+CHARS_PER_TOKEN = 4
+
+# Message roles passed on to the agent as chat history
+HISTORY_ROLES = frozenset({"user", "assistant", "system"})
+
+_role_and_content = operator.attrgetter("role", "content")
+
+# Server-sent event framing
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
 
 class ChatMessage(BaseModel):
     """OpenAI chat message model."""
@@ -96,44 +114,28 @@ async def create_streaming_response(
     # This is a placeholder - replace with actual agent streaming logic
     response_text = "Hello from LC MCP App! This is a streaming response."
 
-    # Stream each character
-    for char in response_text:
-        chunk = ChatCompletionChunk(
-            id=request_id,
-            created=created,
-            model=model,
-            choices=[
-                ChatCompletionChoice(
-                    index=0,
-                    delta={"content": char} if char else {},
-                    finish_reason=None
-                )
-            ]
-        )
+    # Chunk envelope built once per request (same shape as a serialized
+    # ChatCompletionChunk); only the delta content changes per frame
+    delta: dict[str, Any] = {"content": ""}
+    envelope = {
+        "id": request_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": model,
+        "choices": [{"index": 0, "message": None, "delta": delta, "finish_reason": None}],
+    }
 
-        chunk_json = orjson.dumps(chunk.dict())
-        yield b"data: " + chunk_json + b"\n\n"
+    # Stream the text in batches of characters
+    for start in range(0, len(response_text), STREAM_CHUNK_CHARS):
+        delta["content"] = response_text[start:start + STREAM_CHUNK_CHARS]
+        yield b"".join((_SSE_PREFIX, orjson.dumps(envelope), _SSE_SUFFIX))
 
         # Small delay to simulate streaming
-        import asyncio
         await asyncio.sleep(0.01)
 
     # Send final chunk with finish_reason
-    final_chunk = ChatCompletionChunk(
-        id=request_id,
-        created=created,
-        model=model,
-        choices=[
-            ChatCompletionChoice(
-                index=0,
-                delta={},
-                finish_reason="stop"
-            )
-        ]
-    )
-
-    final_chunk_json = orjson.dumps(final_chunk.dict())
-    yield b"data: " + final_chunk_json + b"\n\n"
+    envelope["choices"] = [{"index": 0, "message": None, "delta": {}, "finish_reason": "stop"}]
+    yield b"".join((_SSE_PREFIX, orjson.dumps(envelope), _SSE_SUFFIX))
     yield b"data: [DONE]\n\n"
 
 
@@ -151,14 +153,15 @@ def create_non_streaming_response(
     # This is a placeholder - replace with actual agent logic
     response_content = "Hello from LC MCP App! This is a non-streaming response."
 
-    return ChatCompletionResponse(
+    # All fields are generated here, so skip validation with model_construct()
+    return ChatCompletionResponse.model_construct(
         id=request_id,
         created=created,
         model=model,
         choices=[
-            ChatCompletionChoice(
+            ChatCompletionChoice.model_construct(
                 index=0,
-                message=ChatMessage(
+                message=ChatMessage.model_construct(
                     role="assistant",
                     content=response_content
                 ),
@@ -175,20 +178,27 @@ def create_non_streaming_response(
 
 def get_available_models() -> ModelListResponse:
     """Get list of available models."""
+    return _model_list(settings.openai_default_model, settings.openai_model_name)
+
+
+@lru_cache(maxsize=4)
+def _model_list(default_model: str, model_name: str) -> ModelListResponse:
+    """Build the model list once per configured model pair."""
+    created = int(time.time())
     models = [
         ModelInfo(
-            id=settings.openai_default_model,
-            created=int(time.time()),
+            id=default_model,
+            created=created,
             owned_by="lc-mcp-app"
         )
     ]
 
     # Add configured model if different
-    if settings.openai_model_name != settings.openai_default_model:
+    if model_name != default_model:
         models.append(
             ModelInfo(
-                id=settings.openai_model_name,
-                created=int(time.time()),
+                id=model_name,
+                created=created,
                 owned_by="lc-mcp-app"
             )
         )
@@ -226,16 +236,12 @@ def extract_user_message(messages: list[ChatMessage]) -> str:
 
 def format_chat_history(messages: list[ChatMessage]) -> list[dict[str, Any]]:
     """Format messages for agent consumption."""
-    formatted = []
-
-    for message in messages[:-1]:  # Exclude last message (current user input)
-        if message.role in ["user", "assistant", "system"]:
-            formatted.append({
-                "role": message.role,
-                "content": message.content
-            })
-
-    return formatted
+    # Exclude last message (current user input)
+    return [
+        {"role": role, "content": content}
+        for role, content in map(_role_and_content, messages[:-1])
+        if role in HISTORY_ROLES
+    ]
 
 
 def calculate_token_usage(
@@ -246,11 +252,11 @@ def calculate_token_usage(
     """Calculate token usage (placeholder implementation)."""
     # This is a simplified calculation
     # In production, use tiktoken or similar for accurate counting
-    prompt_tokens = len(prompt.split()) * 1.3  # Rough approximation
-    completion_tokens = len(completion.split()) * 1.3
+    prompt_tokens = len(prompt) // CHARS_PER_TOKEN  # Rough approximation
+    completion_tokens = len(completion) // CHARS_PER_TOKEN
 
     return {
-        "prompt_tokens": int(prompt_tokens),
-        "completion_tokens": int(completion_tokens),
-        "total_tokens": int(prompt_tokens + completion_tokens)
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens
     }
@@ -2,20 +2,23 @@
 Main FastAPI server with OpenAI-compatible endpoints and ASGI lifespan management.
 """
 
-import asyncio
 import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from .clients.mcp_client import close_mcp_client, get_mcp_client
 from .config import settings
 from .middleware.auth import require_api_key
 from .middleware.metrics import metrics_endpoint, record_metrics
-from .middleware.rate_limit import periodic_cleanup, rate_limit
+from .middleware.rate_limit import (
+    close_rate_limit_backend,
+    init_rate_limit_backend,
+    rate_limit,
+)
 from .observability.logging import configure_logging, get_logger, set_correlation_id
 from .openai_models import (
     ChatCompletionRequest,
@@ -54,8 +57,8 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to initialize tools", error=str(e))
         # Continue startup even if tool initialization fails
 
-    # Start background tasks
-    cleanup_task = asyncio.create_task(periodic_cleanup())
+    # Connect shared rate limit store (no-op for the memory backend)
+    await init_rate_limit_backend()
 
     logger.info("Server startup complete")
 
@@ -64,16 +67,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down LC MCP App server")
 
-    # Cancel background tasks
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
-
     # Close MCP client
     await close_mcp_client()
 
+    # Close rate limit store
+    await close_rate_limit_backend()
+
     logger.info("Server shutdown complete")
 
 
@@ -187,7 +186,7 @@ def register_routes(app: FastAPI):
                 # Streaming response
                 async def stream_generator() -> AsyncIterator[bytes]:
                     async for chunk in create_streaming_response(
-                        messages=[msg.dict() for msg in request.messages],
+                        messages=[msg.model_dump() for msg in request.messages],
                         model=model
                     ):
                         yield chunk
@@ -205,11 +204,12 @@ def register_routes(app: FastAPI):
             else:
                 # Non-streaming response
                 response = create_non_streaming_response(
-                    messages=[msg.dict() for msg in request.messages],
+                    messages=[msg.model_dump() for msg in request.messages],
                     model=model
                 )
 
-                return JSONResponse(content=response.dict())
+                # Serialized by pydantic-core directly to JSON bytes
+                return Response(content=response.model_dump_json(), media_type="application/json")
 
         except ValueError as e:
             logger.warning("Invalid request", error=str(e), correlation_id=correlation_id)
@@ -301,5 +301,5 @@ if __name__ == "__main__":
         log_level=settings.app_log_level,
         reload=settings.app_reload,
         workers=settings.app_workers if not settings.app_reload else 1,
-        loop="uvloop" if not settings.is_development else "auto"
+        loop="auto"
     )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import TypedDict
 
 
@@ -9,6 +10,15 @@ class TcResult(TypedDict):
     method: str
 
 
+@lru_cache(maxsize=1024)
+def _allen_dynes_tc(lam: float, mu_star: float, theta_log: float) -> float:
+    denom = 1.04 * (1.0 + lam) - lam * mu_star * (1.0 + 0.62 * lam)
+    # Guard against division/pathological values
+    if denom <= 0:
+        return 0.0
+    return (theta_log / 1.2) * math.exp(-1.04 * (1.0 + lam) / denom)
+
+
 class SuperconductivityCalculatorTool:
     """Estimate Tc using the Allen–Dynes (McMillan) formula.
 
@@ -26,10 +36,5 @@ class SuperconductivityCalculatorTool:
         mu_star = float(params.get("mu_star", 0.13))
         theta_log = float(params["theta_log"])
 
-        denom = 1.04 * (1.0 + lam) - lam * mu_star * (1.0 + 0.62 * lam)
-        # Guard against division/pathological values
-        if denom <= 0:
-            return {"tc_k": 0.0, "method": "allen-dynes"}
-
-        tc = (theta_log / 1.2) * math.exp(-1.04 * (1.0 + lam) / denom)
-        return {"tc_k": float(tc), "method": "allen-dynes"}
+        tc = _allen_dynes_tc(lam, mu_star, theta_log)
+        return {"tc_k": tc, "method": "allen-dynes"}
@@ -0,0 +1,30 @@
+"""
+Tests for structured logging processors.
+"""
+
+from lc_mcp_app.observability.logging import sanitize_sensitive_data
+
+
+def test_sanitize_redacts_sensitive_keys():
+    """Test that sensitive keys are redacted at any depth."""
+    event = {
+        "event": "request",
+        "API_KEY": "sk-1234567890abcdef",
+        "nested": {"token": "short", "inner": {"client_secret": "x"}, "count": 3},
+    }
+
+    sanitized = sanitize_sensitive_data(None, "info", event)
+
+    assert sanitized["API_KEY"] == "sk-1***cdef"
+    assert sanitized["nested"]["token"] == "***REDACTED***"
+    assert sanitized["nested"]["inner"]["client_secret"] == "***REDACTED***"
+    assert sanitized["nested"]["count"] == 3
+    # The caller's dicts are left untouched
+    assert event["nested"]["token"] == "short"
+
+
+def test_sanitize_returns_clean_event_unchanged():
+    """Test that events without sensitive keys are not copied."""
+    event = {"event": "request", "path": "/v1/models", "extra": {"status": 200}}
+
+    assert sanitize_sensitive_data(None, "info", event) is event
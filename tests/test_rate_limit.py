@@ -0,0 +1,169 @@
+"""
+Tests for the rate limiting middleware.
+"""
+
+import asyncio
+import importlib
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from lc_mcp_app.config import Settings, settings
+from lc_mcp_app.server import create_app
+
+# The package re-exports the middleware function under the module's name
+rl = importlib.import_module("lc_mcp_app.middleware.rate_limit")
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a small rate limit."""
+    # Override settings for testing
+    settings.environment = "testing"
+    settings.api_keys = []  # Disable auth for testing
+    settings.metrics_enabled = False
+    settings.rate_limit_rpm = 3
+    settings.rate_limit_burst = 0
+
+    rl.buckets.clear()
+    app = create_app()
+    yield TestClient(app)
+
+    settings.rate_limit_rpm = 120
+    settings.rate_limit_burst = 60
+    rl.buckets.clear()
+
+
+def test_rate_limit_headers(client):
+    """Test that rate limit headers are added to responses."""
+    response = client.get("/v1/models")
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Limit"] == "3"
+    assert response.headers["X-RateLimit-Remaining"] == "2"
+    assert "X-RateLimit-Reset" in response.headers
+
+
+def test_rate_limit_exempt_endpoints(client):
+    """Test that health checks do not consume tokens."""
+    for _ in range(5):
+        client.get("/health")
+
+    response = client.get("/v1/models")
+    assert response.headers["X-RateLimit-Remaining"] == "2"
+
+
+def test_rate_limit_refill(client, monkeypatch):
+    """Test that tokens are refilled over time."""
+    now = [1000.0]
+    monkeypatch.setattr(rl, "_now", lambda: now[0])
+
+    for _ in range(3):
+        client.get("/v1/models")
+    assert rl.buckets["testclient"].tokens == 0.0
+
+    now[0] += 20.0  # 3 requests/minute -> one token every 20 seconds
+    response = client.get("/v1/models")
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+
+
+def test_rate_limit_evicts_least_recent(client):
+    """Test that the oldest bucket is evicted once the tracked IP cap is reached."""
+    settings.rate_limit_max_tracked_ips = 2
+    try:
+        rl.buckets["first"] = rl.BucketState(1.0, 0.0)
+        rl.buckets["second"] = rl.BucketState(1.0, 0.0)
+
+        client.get("/v1/models")
+
+        assert list(rl.buckets) == ["second", "testclient"]
+    finally:
+        settings.rate_limit_max_tracked_ips = 100_000
+
+
+def test_rate_limit_exceeded(client):
+    """Test that requests over the limit get a 429 response."""
+    for _ in range(3):
+        assert client.get("/v1/models").status_code == 200
+
+    response = client.get("/v1/models")
+    assert response.status_code == 429
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+    assert int(response.headers["Retry-After"]) >= 1
+
+    detail = response.json()["detail"]
+    assert detail["error"] == "Rate limit exceeded"
+    assert detail["limit"] == 3
+
+
+def test_rate_limit_zero_rpm(client):
+    """Test that rate_limit_rpm=0 still allows the burst instead of failing."""
+    settings.rate_limit_rpm = 0
+    settings.rate_limit_burst = 2
+
+    assert [client.get("/v1/models").status_code for _ in range(3)] == [200, 200, 429]
+
+    settings.rate_limit_burst = 0
+    rl.buckets.clear()
+    assert client.get("/v1/models").status_code == 429
+
+
+def test_client_ip_from_proxy_headers(client):
+    """Test that proxy headers take precedence over the peer address."""
+    client.get("/v1/models", headers={"X-Forwarded-For": "203.0.113.7, 10.0.0.1"})
+    client.get("/v1/models", headers={"X-Real-IP": " 198.51.100.2 "})
+
+    assert list(rl.buckets) == ["203.0.113.7", "198.51.100.2"]
+
+
+def test_max_tracked_ips_must_be_positive():
+    """Test that a zero-sized bucket table is rejected at startup."""
+    with pytest.raises(ValidationError):
+        Settings(rate_limit_max_tracked_ips=0)
+
+
+async def test_redis_token_bucket(monkeypatch):
+    """Test the Redis Lua token bucket against an in-memory Redis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+
+    redis = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(rl, "_redis_script", redis.register_script(rl.TOKEN_BUCKET_LUA))
+
+    results = [await rl._take_token_redis("10.0.0.1", 1000.0, 2, 0.05) for _ in range(3)]
+    assert results == [(True, 1.0), (True, 0.0), (False, 0.0)]
+
+    # One token every 20 seconds at 3 requests/minute
+    assert await rl._take_token_redis("10.0.0.1", 1020.0, 2, 0.05) == (True, 0.0)
+    assert await redis.ttl("rl:10.0.0.1") == 40
+
+
+async def test_redis_timeout_on_hung_server(monkeypatch):
+    """Test that a Redis server that never answers fails fast instead of hanging."""
+    writers = []
+
+    async def accept_and_hang(reader, writer):
+        writers.append(writer)  # Never answer; closed in the finally below
+
+    server = await asyncio.start_server(accept_and_hang, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    monkeypatch.setattr(settings, "rate_limit_backend", "redis")
+    monkeypatch.setattr(settings, "redis_url", f"redis://127.0.0.1:{port}/0")
+    monkeypatch.setattr(settings, "redis_timeout_s", 0.05)
+
+    await rl.init_rate_limit_backend()
+    try:
+        start = time.monotonic()
+        with pytest.raises(RedisError):
+            await rl._take_token_redis("10.0.0.1", 1000.0, 2, 0.05)
+        assert time.monotonic() - start < 1.0
+    finally:
+        await rl.close_rate_limit_backend()
+        for writer in writers:
+            writer.close()
+            await writer.wait_closed()
+        server.close()
+        await server.wait_closed()